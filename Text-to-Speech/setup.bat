@@ -145,6 +145,17 @@ if errorlevel 1 (
     del "ffmpeg.zip"
 )
 
+REM Download the word list used to correct misread OCR words (optional)
+if not exist "dictionaries\frequency_dictionary_en.txt" (
+    echo Downloading OCR correction dictionary...
+    if not exist "dictionaries" mkdir dictionaries
+    powershell -Command "& {Invoke-WebRequest -Uri 'https://raw.githubusercontent.com/wolfgarbe/SymSpell/master/SymSpell/frequency_dictionary_en_82_765.txt' -OutFile 'dictionaries\frequency_dictionary_en.txt'}"
+    if errorlevel 1 (
+        echo WARNING: Could not download the OCR correction dictionary. OCR text will not be spell-corrected.
+        echo Failed to download OCR dictionary >> "%LOG_FILE%"
+    )
+)
+
 REM Check for Tesseract-OCR folder
 if not exist "Tesseract-OCR" (
     echo.